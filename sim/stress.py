@@ -0,0 +1,437 @@
+# AXOBOTL Python Code
+# Team 4028X Extreme Axolotls
+# 2023-25 VEX IQ Rapid Relay Challenge
+#
+# Stress test for the robot code, run on a computer (not the robot):
+#
+#     python sim/stress.py                          # 50 random trials of src/main.py
+#     python sim/stress.py --program src/DriveBot.py --trials 200
+#     python sim/stress.py --seed 1234 --trials 1 --trace   # replay one failure
+#
+# Each trial loads the program on top of the stand-in vex module, then mashes
+# controller buttons (mostly LDown) in random bursts while the distance
+# sensors jitter and glitch. After every step we check that the robot still
+# makes sense. Every failure prints the seed that reproduces it exactly.
+#
+# What we check:
+#   - belts: after stopAll() and everything it kicked off are done, no belt
+#     motor is spinning and the hugger is where stopAll() left it
+#   - flags: whenever no handler is running, catBeltRunning and intakeRunning
+#     match what the motors are really doing
+#   - catapult: it never fires while windCat() is running
+#   - stuck: no button or event handler runs longer than --stuck seconds
+#   - hang: no handler loops without calling wait() (the brain would freeze)
+#   - crash: no handler raises an exception
+import argparse
+import os
+import re
+import shlex
+import sys
+import traceback
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import vex  # noqa: E402  (our stand-in, not the real one)
+
+
+# Wiring from src/main.py and src/DriveBot.py
+BELT_PORTS = (vex.Ports.PORT3, vex.Ports.PORT11)
+INTAKE_PORTS = (vex.Ports.PORT4, vex.Ports.PORT1)
+HUGGER_PORT = vex.Ports.PORT10
+INTAKE_EYE_PORT = vex.Ports.PORT6
+TOP_EYE_PORT = vex.Ports.PORT5
+CAT_EYE_PORT = vex.Ports.PORT2
+BACK_EYE_PORT = vex.Ports.PORT8
+
+WIND_FUNCTION = "windCat"
+STOP_BUTTON = "buttonFUp"
+MASH_BUTTON = "buttonLDown"
+
+
+class Violation(Exception):
+    def __init__(self, kind: str, message: str, stacks: str = ""):
+        super().__init__(message)
+        self.kind = kind
+        self.message = message
+        self.stacks = stacks
+
+
+# ============================================================================
+# The world around the robot: balls and the catapult
+# ============================================================================
+
+class World:
+    # These numbers are our best guess at the Gen3 bot. Tune them if the
+    # harness complains about something the real robot never does.
+    BALL_MM = 20  # What an eye reads with a ball right in front of it
+    EMPTY_MM = 250
+    CAT_DOWN_MM = 15
+    CAT_UP_MM = 200
+    WOUND_DEGREES = 250  # The cat eye sees the catapult from here...
+    FIRE_DEGREES = 360  # ...until the slip gear lets go here
+    FEED_DEGREES = 216  # About 300ms of belt or intake at 100%
+
+    def __init__(self, sim: vex.Simulation, noiseMm: float, spikeChance: float):
+        self.sim = sim
+        self.rng = sim.rng
+        self.noiseMm = noiseMm
+        self.spikeChance = spikeChance
+        self.balls: dict = {"intake": False, "top": False, "back": False}
+        self.catDegrees: float = 0.0
+        self.beltFeed: float = 0.0
+        self.intakeFeed: float = 0.0
+        self.nextBallAt: float = 0.0
+        self.fired: int = 0
+        self.onFire: list = []
+
+    def noisy(self, mm: float) -> float:
+        if self.rng.random() < self.spikeChance:
+            return self.rng.uniform(0, 400)  # Glitch: a bogus reading
+        return max(0.0, mm + self.rng.gauss(0, self.noiseMm))
+
+    def tick(self):
+        belt = self.sim.motorOn(BELT_PORTS[0])
+        intake = self.sim.motorOn(INTAKE_PORTS[0])
+        if belt is not None: self.moveBelt(belt.moved)
+        if intake is not None: self.moveIntake(intake.moved)
+        if not self.balls["intake"] and self.sim.now >= self.nextBallAt:
+            self.balls["intake"] = True  # A driver loaded a new ball
+            self.nextBallAt = self.sim.now + self.rng.randint(500, 4000)
+        self.updateEyes()
+
+    def moveBelt(self, degrees: float):
+        if degrees > 0:  # FORWARD winds the catapult
+            self.catDegrees += degrees
+            if self.catDegrees >= self.FIRE_DEGREES:
+                self.catDegrees = 0.0
+                self.fired += 1
+                self.sim.log("catapult fired")
+                for callback in self.onFire: callback()
+        elif degrees < 0:  # REVERSE feeds balls up into the catapult
+            self.beltFeed -= degrees
+            if self.beltFeed >= self.FEED_DEGREES:
+                self.beltFeed = 0.0
+                if self.balls["back"]:
+                    self.balls["back"] = False
+                elif self.balls["top"]:
+                    self.balls["top"] = False
+                    self.balls["back"] = True
+
+    def moveIntake(self, degrees: float):
+        if degrees > 0 and self.balls["intake"]:  # FORWARD spits the ball out
+            self.balls["intake"] = False
+        elif degrees < 0:
+            self.intakeFeed -= degrees
+            if self.intakeFeed >= self.FEED_DEGREES:
+                self.intakeFeed = 0.0
+                if self.balls["intake"] and not self.balls["top"]:
+                    self.balls["intake"] = False
+                    self.balls["top"] = True
+
+    def updateEyes(self):
+        catDown = self.WOUND_DEGREES <= self.catDegrees < self.FIRE_DEGREES
+        readings = {
+            INTAKE_EYE_PORT: self.BALL_MM if self.balls["intake"] else self.EMPTY_MM,
+            TOP_EYE_PORT: self.BALL_MM if self.balls["top"] else self.EMPTY_MM,
+            BACK_EYE_PORT: self.BALL_MM if self.balls["back"] else self.EMPTY_MM,
+            CAT_EYE_PORT: self.CAT_DOWN_MM if catDown else self.CAT_UP_MM,
+        }
+        for port, mm in readings.items():
+            sensor = self.sim.distanceOn(port)
+            if sensor is not None: sensor.trueMm = mm
+
+
+# ============================================================================
+# One trial
+# ============================================================================
+
+class Trial:
+    def __init__(self, programPath: str, code, seed: int, options):
+        self.programPath = programPath
+        self.code = code
+        self.seed = seed
+        self.options = options
+        self.sim = vex.begin(seed, options.hangTimeout, traceSize=None if options.trace else 80,
+                             stepCostMs=options.stepCost)
+        self.world = World(self.sim, options.noise, options.spike)
+        self.sim.sensorNoise = self.world.noisy
+        self.sim.coalesceSensorEvents = options.coalesce
+        self.sim.onTick.append(self.world.tick)
+        self.world.onFire.append(self.checkNotWinding)
+        self.sim.onFinish.append(self.onTaskFinished)
+        self.namespace: dict = {"__name__": "__main__", "__file__": programPath, "print": self.sim.consolePrint}
+        self.controller = None
+        self.buttons: list = []
+        self.presses: int = 0
+        self.lastPress = None  # (button name, tasks it started)
+        self.huggerAfterStop = None
+        self.latencies: list = []  # (button, response ms, done ms)
+        self.failure = None
+
+    # ------------------------------------------------------------- helpers
+
+    def motors(self, ports) -> list:
+        return [motor for motor in (self.sim.motorOn(port) for port in ports) if motor is not None]
+
+    def hugger(self):
+        return next((p for p in self.sim.pneumatics if p.port == HUGGER_PORT), None)
+
+    def flag(self, name: str):
+        # main.py keeps its flags as globals, DriveBot.py keeps them on the bot
+        if name in self.namespace: return self.namespace[name]
+        for button in self.buttons:
+            for callback in button.onPressed:
+                owner = getattr(callback, "__self__", None)
+                if owner is not None and hasattr(owner, name): return getattr(owner, name)
+        return None
+
+    def formatStack(self, task: vex.Task) -> str:
+        lines = []
+        for frame in task.frames():
+            if frame.f_code.co_filename == self.programPath:
+                lines.append("      %s:%d in %s" % (os.path.relpath(self.programPath), frame.f_lineno,
+                                                     frame.f_code.co_name))
+        return "    %s (started %.3f s)\n%s" % (task.name, task.startedAt / 1000, "\n".join(lines))
+
+    # -------------------------------------------------------------- checks
+
+    def onTaskFinished(self, task: vex.Task):
+        if task.kind == "button":
+            response = None if task.firstCommandAt is None else task.firstCommandAt - task.startedAt
+            self.latencies.append((task.name, response, task.finishedAt - task.startedAt))
+        if self.lastPress is not None and task in self.lastPress[1] and self.lastPress[0] == STOP_BUTTON:
+            hugger = self.hugger()
+            self.huggerAfterStop = hugger.state() if hugger is not None else None
+
+    def fail(self, kind: str, message: str, tasks: list = ()):
+        if kind in self.options.ignore: return
+        raise Violation(kind, message, "\n".join(self.formatStack(task) for task in tasks))
+
+    def checkNotWinding(self):
+        winders = [task.name for task in self.sim.tasks
+                   if any(frame.f_code.co_name == WIND_FUNCTION for frame in task.frames())]
+        if winders:
+            self.fail("catapult", "catapult fired while %s() was running in %s"
+                      % (WIND_FUNCTION, ", ".join(winders)), self.sim.handlers())
+
+    def check(self) -> bool:
+        if self.sim.errors:
+            task = self.sim.errors[0]
+            details = "".join(traceback.format_exception(task.error)).rstrip()
+            raise Violation("crash", "%s raised %r" % (task.name, task.error), details)
+        handlers = self.sim.handlers()
+        stuck = [task for task in handlers if self.sim.now - task.startedAt > self.options.stuck * 1000]
+        if stuck:
+            self.fail("stuck", "%s still running after %.1f s" % (stuck[0].name, self.options.stuck), stuck)
+        if not handlers: self.checkSettled()
+        return False
+
+    def checkSettled(self):
+        belts = self.motors(BELT_PORTS)
+        intakes = self.motors(INTAKE_PORTS)
+        beltsSpinning = any(motor.is_spinning() for motor in belts)
+        intakeSpinning = any(motor.is_spinning() for motor in intakes)
+        catBeltRunning = self.flag("catBeltRunning")
+        intakeRunning = self.flag("intakeRunning")
+        if catBeltRunning is not None and belts and bool(catBeltRunning) != beltsSpinning:
+            self.fail("flags", "catBeltRunning is %s but the belts are %s"
+                            % (catBeltRunning, "spinning" if beltsSpinning else "stopped"))
+        if intakeRunning is not None and intakes and bool(intakeRunning) != intakeSpinning:
+            self.fail("flags", "intakeRunning is %s but the intake is %s"
+                            % (intakeRunning, "spinning" if intakeSpinning else "stopped"))
+        if self.lastPress is not None and self.lastPress[0] == STOP_BUTTON:
+            spinning = [motor for motor in belts if motor.is_spinning()]
+            if spinning:
+                self.fail("belts", "%s still spinning %r after stopAll settled"
+                                % (spinning[0], spinning[0].direction))
+            hugger = self.hugger()
+            if hugger is not None and self.huggerAfterStop is not None and hugger.state() != self.huggerAfterStop:
+                self.fail("belts", "hugger is %s after stopAll settled, stopAll left it %s"
+                                % ("/".join(hugger.state()), "/".join(self.huggerAfterStop)))
+
+    # ------------------------------------------------------------- stimulus
+
+    def press(self, button):
+        self.presses += 1
+        self.huggerAfterStop = None
+        self.lastPress = (button.name, button.press())
+
+    def scheduleBurst(self, startMs: float, endMs: float, freeAt: dict):
+        rng = self.sim.rng
+        weights = [self.options.mash if button.name == MASH_BUTTON else 1 for button in self.buttons]
+        timeMs = startMs
+        for _ in range(rng.randint(1, self.options.burst)):
+            button = rng.choices(self.buttons, weights)[0]
+            timeMs = max(timeMs, freeAt[button.name])
+            if timeMs >= endMs: return
+            holdMs = rng.randint(20, 400)
+            self.sim.at(timeMs, lambda button=button: self.press(button))
+            self.sim.at(timeMs + holdMs, button.release)
+            freeAt[button.name] = timeMs + holdMs + 10
+            timeMs += rng.randint(10, 120)
+        nextMs = timeMs + rng.randint(0, 3000)
+        if nextMs < endMs:
+            self.sim.at(nextMs, lambda: self.scheduleBurst(nextMs, endMs, freeAt))
+
+    # ----------------------------------------------------------------- run
+
+    def run(self):
+        try:
+            self.sim.spawn(lambda: exec(self.code, self.namespace), "program", "main")
+            self.sim.runUntil(1000, self.check)  # Let setup() finish
+            if not self.sim.controllers:
+                raise Violation("setup", "the program never made a Controller")
+            self.controller = self.sim.controllers[0]
+            self.buttons = [button for button in self.controller.buttons.values()
+                            if button.onPressed or button.onReleased]
+            if not self.buttons:
+                raise Violation("setup", "the program never binds a controller button")
+            stormEnd = self.sim.now + self.options.duration * 1000
+            freeAt = {button.name: 0.0 for button in self.buttons}
+            self.scheduleBurst(self.sim.now, stormEnd, freeAt)
+            self.sim.runUntil(stormEnd, self.check)
+
+            # Hands off the controller, hit stopAll and wait for things to settle
+            for button in self.buttons:
+                if button.down: button.release()
+            stop = self.controller.buttons[STOP_BUTTON]
+            if stop.onPressed: self.press(stop)
+            settleEnd = self.sim.now + self.options.stuck * 1000 + 1000
+            self.sim.runUntil(settleEnd, lambda: self.check() or not self.sim.handlers())
+            self.check()
+        except Violation as violation:
+            self.failure = violation
+        except vex.Hang as hang:
+            # Can't stop that thread, so leave everything as it is
+            self.failure = Violation("hang", "%s looped for %.1f s (real time) without calling wait()"
+                                     % (hang.task.name, self.options.hangTimeout), self.formatStack(hang.task))
+            return self
+        self.sim.shutdown()
+        return self
+
+
+# ============================================================================
+# Report
+# ============================================================================
+
+def reproduceCommand(options, seed: int) -> str:
+    # Copy every option that isn't at its default, so new flags come along too.
+    # Option names are the camelCase dest turned back into --kebab-case.
+    parts = ["python", os.path.relpath(os.path.abspath(__file__)), "--program", options.program,
+             "--seed", str(seed), "--trials", "1", "--trace"]
+    defaults = vars(parser().parse_args([]))
+    for name, value in vars(options).items():
+        if name in ("program", "seed", "trials", "trace", "first") or value == defaults[name]:
+            continue
+        flag = "--" + re.sub(r"([A-Z])", lambda match: "-" + match.group(1).lower(), name)
+        if value is True:
+            parts.append(flag)
+        elif isinstance(value, list):
+            for each in value: parts += [flag, str(each)]
+        else:
+            parts += [flag, str(value)]
+    return shlex.join(parts)
+
+
+def printFailure(trial: Trial, options):
+    failure = trial.failure
+    print("FAIL seed %d [%s] at %.3f s: %s" % (trial.seed, failure.kind, trial.sim.now / 1000, failure.message))
+    if failure.stacks: print(failure.stacks)
+    print("  reproduce: %s" % reproduceCommand(options, trial.seed))
+    if not options.trace:
+        print("  last events:")
+        for timeMs, name, message in list(trial.sim.trace)[-15:]:
+            print("    %9.3f  %-22s %s" % (timeMs / 1000, name, message))
+
+
+def printTrace(trial: Trial):
+    for timeMs, name, message in trial.sim.trace:
+        print("%9.3f  %-22s %s" % (timeMs / 1000, name, message))
+
+
+def printLatencies(trials: list):
+    worst: dict = {}  # button -> [count, total done, (worst done, seed), (worst response, seed)]
+    for trial in trials:
+        for button, response, done in trial.latencies:
+            entry = worst.setdefault(button, [0, 0.0, (-1.0, None), (-1.0, None)])
+            entry[0] += 1
+            entry[1] += done
+            if done > entry[2][0]: entry[2] = (done, trial.seed)
+            if response is not None and response > entry[3][0]: entry[3] = (response, trial.seed)
+    if not worst: return
+    print("latency in virtual ms (press -> first motor command, press -> handler done):")
+    for button in sorted(worst):
+        count, total, (done, doneSeed), (response, responseSeed) = worst[button]
+        if responseSeed is None:
+            responseText = "response   no command"  # Its handlers never moved anything
+        else:
+            responseText = "response worst %6.0f (seed %s)" % (response, responseSeed)
+        print("  %-12s n=%-6d %-31s   done mean %6.0f worst %6.0f (seed %s)"
+              % (button, count, responseText, total / count, done, doneSeed))
+
+
+def atLeast(convert, lowest, above: bool = False):
+    # An argparse type that also checks the range, e.g. atLeast(int, 1)
+    def check(text: str):
+        value = convert(text)
+        if value < lowest or (above and value == lowest):
+            raise argparse.ArgumentTypeError("must be %s %s" % ("more than" if above else "at least", lowest))
+        return value
+    return check
+
+
+def parser() -> argparse.ArgumentParser:
+    here = os.path.dirname(os.path.abspath(__file__))
+    defaultProgram = os.path.relpath(os.path.join(here, "..", "src", "main.py"))
+    args = argparse.ArgumentParser(description="Fuzz the robot code with button storms and sensor noise.")
+    args.add_argument("--program", default=defaultProgram, help="robot program to load (default: %(default)s)")
+    args.add_argument("--trials", type=atLeast(int, 1), default=50, help="how many random trials (default: %(default)s)")
+    args.add_argument("--seed", type=int, default=1, help="seed of the first trial, the rest count up from it")
+    args.add_argument("--duration", type=atLeast(float, 0, above=True), default=30.0, help="seconds of button storm per trial")
+    args.add_argument("--noise", type=atLeast(float, 0), default=6.0, help="distance sensor noise in mm (std dev)")
+    args.add_argument("--spike", type=atLeast(float, 0), default=0.02, help="chance a distance reading is garbage")
+    args.add_argument("--stuck", type=atLeast(float, 0, above=True), default=25.0, help="seconds before a handler counts as stuck")
+    args.add_argument("--burst", type=atLeast(int, 1), default=12, help="most presses in one burst")
+    args.add_argument("--mash", type=atLeast(float, 0, above=True), default=4.0, help="how much more often buttonLDown gets pressed")
+    args.add_argument("--coalesce", action="store_true",
+                      help="drop a sensor change while that sensor's last changed() handler is still running")
+    args.add_argument("--step-cost", dest="stepCost", type=atLeast(float, 0), default=1.0,
+                      help="virtual ms each turn of robot code takes (default: %(default)s)")
+    args.add_argument("--hang-timeout", dest="hangTimeout", type=atLeast(float, 0, above=True), default=5.0,
+                      help="real seconds a handler may run without wait() before we call it a hang")
+    args.add_argument("--trace", action="store_true", help="print every event (use with --trials 1)")
+    args.add_argument("--ignore", action="append", default=[], metavar="KIND",
+                      choices=("belts", "flags", "catapult", "stuck"), help="don't fail on this kind of check")
+    args.add_argument("--first", action="store_true", help="stop after the first failing trial")
+    return args
+
+
+def main(argv = None) -> int:
+    options = parser().parse_args(argv)
+    programPath = os.path.abspath(options.program)
+    with open(programPath) as file:
+        code = compile(file.read(), programPath, "exec")
+
+    trials: list = []
+    failures: list = []
+    for seed in range(options.seed, options.seed + options.trials):
+        trial = Trial(programPath, code, seed, options).run()
+        trials.append(trial)
+        if options.trace: printTrace(trial)
+        if trial.failure is not None:
+            failures.append(trial)
+            printFailure(trial, options)
+            if trial.failure.kind == "hang":
+                print("  (a runaway thread is still going, so we stop here)")
+                break
+            if options.first: break
+
+    presses = sum(trial.presses for trial in trials)
+    fired = sum(trial.world.fired for trial in trials)
+    print("%s: %d trial(s) from seed %d, %d presses, %d catapult shots, %d failure(s)"
+          % (os.path.relpath(programPath), len(trials), options.seed, presses, fired, len(failures)))
+    printLatencies(trials)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
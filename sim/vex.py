@@ -0,0 +1,642 @@
+# AXOBOTL Python Code
+# Team 4028X Extreme Axolotls
+# 2023-25 VEX IQ Rapid Relay Challenge
+#
+# A stand-in for the VEX IQ "vex" module so our robot code can run on a
+# computer. It is NOT copied to the robot. stress.py uses it to shake the
+# robot code with button storms and noisy sensors.
+#
+# The real brain runs every thread and event handler one at a time and only
+# switches between them when someone calls wait() or sleep(). We copy that:
+# each robot task is a Python thread, but only one is ever allowed to run,
+# and the scheduler picks who goes next using a seeded random number
+# generator. Time is "virtual" (nobody really sleeps), so the same seed
+# always gives the exact same run. Every turn a task gets costs a little
+# virtual time, so handlers that pile up really do delay each other.
+import heapq
+import math
+import random
+import sys
+import threading
+from collections import deque
+
+__all__ = [
+    "math", "wait", "sleep",
+    "Ports", "DirectionType", "BrakeType", "DistanceUnits", "RotationUnits",
+    "TimeUnits", "VelocityUnits", "PercentUnits", "CylinderType", "FontType",
+    "SoundType", "Color",
+    "FORWARD", "REVERSE", "COAST", "BRAKE", "HOLD", "MM", "INCHES", "DEGREES",
+    "TURNS", "MSEC", "SECONDS", "PERCENT", "RPM",
+    "Brain", "Inertial", "Motor", "Distance", "Touchled", "Bumper",
+    "Pneumatic", "Controller", "Event", "Thread",
+]
+
+
+# ============================================================================
+# Constants (same names the VEX stubs use)
+# ============================================================================
+
+class _Constant:
+    def __init__(self, name: str, value: int):
+        self.name = name
+        self.value = value
+
+    def __repr__(self):
+        return self.name
+
+
+def _constants(name: str, typeName: str, *members: str):
+    # VEX nests the type inside the class, e.g. DirectionType.DirectionType
+    inner = type(typeName, (_Constant,), {})
+    outer = type(name, (), {typeName: inner})
+    for value, member in enumerate(members):
+        setattr(outer, member, inner(member, value))
+    return outer
+
+
+DirectionType = _constants("DirectionType", "DirectionType", "FORWARD", "REVERSE", "UNDEFINED")
+BrakeType = _constants("BrakeType", "BrakeType", "COAST", "BRAKE", "HOLD")
+DistanceUnits = _constants("DistanceUnits", "DistanceUnits", "MM", "IN", "CM")
+RotationUnits = _constants("RotationUnits", "RotationUnits", "DEG", "REV", "RAW")
+TimeUnits = _constants("TimeUnits", "TimeUnits", "SECONDS", "MSEC")
+VelocityUnits = _constants("VelocityUnits", "VelocityUnits", "PERCENT", "RPM", "DPS")
+PercentUnits = _constants("PercentUnits", "PercentUnits", "PERCENT")
+CylinderType = _constants("CylinderType", "CylinderType", "CYLINDER1", "CYLINDER2", "CYLINDERALL")
+FontType = _constants("FontType", "FontType", "MONO12", "MONO15", "MONO20", "MONO30", "MONO40",
+                      "MONO60", "PROP20", "PROP30", "PROP40", "PROP60")
+SoundType = _constants("SoundType", "SoundType", "SIREN", "TADA", "FILLUP", "HEADLIGHTS_ON",
+                       "HEADLIGHTS_OFF", "DOOR_CLOSE", "ALARM", "WRONG_WAY")
+Color = _constants("Color", "DefinedColor", "BLACK", "WHITE", "RED", "GREEN", "BLUE", "YELLOW",
+                   "ORANGE", "PURPLE", "CYAN", "TRANSPARENT")
+
+FORWARD = DirectionType.FORWARD
+REVERSE = DirectionType.REVERSE
+COAST = BrakeType.COAST
+BRAKE = BrakeType.BRAKE
+HOLD = BrakeType.HOLD
+MM = DistanceUnits.MM
+INCHES = DistanceUnits.IN
+DEGREES = RotationUnits.DEG
+TURNS = RotationUnits.REV
+MSEC = TimeUnits.MSEC
+SECONDS = TimeUnits.SECONDS
+PERCENT = VelocityUnits.PERCENT
+RPM = VelocityUnits.RPM
+
+
+class Ports:
+    PORT1 = 0
+    PORT2 = 1
+    PORT3 = 2
+    PORT4 = 3
+    PORT5 = 4
+    PORT6 = 5
+    PORT7 = 6
+    PORT8 = 7
+    PORT9 = 8
+    PORT10 = 9
+    PORT11 = 10
+    PORT12 = 11
+
+
+def _toMs(time: float, units) -> float:
+    return time * 1000 if units is SECONDS else time
+
+
+def _toDegrees(angle: float, units) -> float:
+    return angle * 360 if units is TURNS else angle
+
+
+# ============================================================================
+# The scheduler
+# ============================================================================
+
+class Stopped(BaseException):
+    # Raised inside robot tasks to unwind them when a run is over. It is a
+    # BaseException so robot code can't swallow it with "except Exception".
+    pass
+
+
+class Hang(Exception):
+    # A task ran for too long (in real time) without calling wait(), so the
+    # scheduler never got control back. Its thread is still running.
+    def __init__(self, task):
+        super().__init__("%s never called wait()" % task.name)
+        self.task = task
+
+
+class Task:
+    def __init__(self, sim: "Simulation", fn, name: str, kind: str):
+        self.sim = sim
+        self.fn = fn
+        self.name = name
+        self.kind = kind  # "main", "thread", "button" or "event"
+        self.startedAt: float = sim.now
+        self.wakeAt: float = sim.now
+        self.firstCommandAt = None
+        self.finishedAt = None
+        self.error = None
+        self.alive: bool = True
+        self.stopped: bool = False  # Thread.stop() was called on it
+        self.go = threading.Semaphore(0)
+        self.thread = threading.Thread(target=self.body, name=name, daemon=True)
+
+    def body(self):
+        self.go.acquire()  # Don't start until the scheduler says so
+        try:
+            if not (self.sim.stopping or self.stopped): self.fn()
+        except Stopped:
+            pass
+        except Exception as error:
+            self.error = error
+        finally:
+            self.alive = False
+            self.finishedAt = self.sim.now
+            self.sim.baton.release()
+
+    def frames(self) -> list:
+        # Where the task is right now (innermost last)
+        frame = sys._current_frames().get(self.thread.ident)
+        stack = []
+        while frame is not None:
+            stack.append(frame)
+            frame = frame.f_back
+        stack.reverse()
+        return stack
+
+
+class Simulation:
+    TICK_MS = 5  # How often motors move
+    SENSOR_MS = 20  # How often distance sensors report changes
+
+    def __init__(self, seed: int, hangTimeoutSecs: float = 5.0, traceSize = 80, stepCostMs: float = 1.0):
+        self.rng = random.Random(seed)
+        self.seed = seed
+        self.now: float = 0.0
+        self.hangTimeoutSecs = hangTimeoutSecs
+        self.stepCostMs = stepCostMs  # Virtual time each task gets charged per turn
+        self.tasks: list = []
+        self.current = None
+        self.baton = threading.Semaphore(0)
+        self.stopping: bool = False
+        self.timers: list = []
+        self.timerCount: int = 0
+        self.trace = deque(maxlen=traceSize)
+        self.errors: list = []
+        self.onTick: list = []  # Called after motors move, e.g. to update the world
+        self.onFinish: list = []  # Called with each task that ends
+        self.sensorNoise = lambda mm: mm
+        self.coalesceSensorEvents: bool = False  # See Distance.poll()
+        self.motors: list = []
+        self.distances: list = []
+        self.pneumatics: list = []
+        self.controllers: list = []
+        self.every(self.TICK_MS, self.tick)
+        self.every(self.SENSOR_MS, self.pollSensors)
+
+    # ------------------------------------------------------------------ tasks
+
+    def spawn(self, fn, name: str, kind: str = "event") -> Task:
+        task = Task(self, fn, name, kind)
+        self.tasks.append(task)
+        task.thread.start()
+        return task
+
+    def sleep(self, ms: float):
+        task = self.current
+        if task is None or threading.current_thread() is not task.thread:
+            raise RuntimeError("wait() can only be called from robot code")
+        task.wakeAt = self.now + max(0.0, ms)
+        self.baton.release()  # Hand control back to the scheduler...
+        task.go.acquire()  # ...and park until it is our turn again
+        if self.stopping or task.stopped: raise Stopped()
+
+    def resume(self, task: Task):
+        if not task.stopped: self.now += self.stepCostMs  # Running robot code takes time too
+        self.current = task
+        task.go.release()
+        if not self.baton.acquire(timeout=self.hangTimeoutSecs):
+            raise Hang(task)
+        self.current = None
+        if not task.alive:
+            self.tasks.remove(task)
+            if task.error is not None: self.errors.append(task)
+            for callback in self.onFinish: callback(task)
+
+    def handlers(self) -> list:
+        return [task for task in self.tasks if task.kind in ("button", "event")]
+
+    # ----------------------------------------------------------------- timers
+
+    def at(self, timeMs: float, callback):
+        self.timerCount += 1
+        heapq.heappush(self.timers, (timeMs, self.timerCount, callback))
+
+    def every(self, periodMs: float, callback):
+        # Plan from when it was due, not when it ran. Turns cost time, so
+        # timers often run late, and motors would fall behind the clock.
+        def repeat(dueMs: float):
+            callback()
+            self.at(dueMs + periodMs, lambda: repeat(dueMs + periodMs))
+        firstMs = self.now + periodMs
+        self.at(firstMs, lambda: repeat(firstMs))
+
+    # -------------------------------------------------------------- main loop
+
+    def stop(self, task: Task):
+        task.stopped = True
+        if task is self.current: raise Stopped()  # A thread stopping itself ends right here
+        task.wakeAt = -math.inf  # Unwind it on the very next step
+
+    def step(self):
+        # Timers win ties so presses and sensor changes land before anyone
+        # who wakes up at the same moment gets to react
+        stopped = [task for task in self.tasks if task.stopped]
+        if stopped:
+            self.resume(stopped[0])  # Raises Stopped inside its wait() so it never runs again
+            return
+        taskTime = min((task.wakeAt for task in self.tasks), default=math.inf)
+        if self.timers and self.timers[0][0] <= taskTime:
+            timeMs, _, callback = heapq.heappop(self.timers)
+            self.now = max(self.now, timeMs)
+            callback()
+            return
+        # Anyone whose wait() is over is fair game, not just the earliest.
+        # That way a freshly pressed button can get stuck behind others.
+        self.now = max(self.now, taskTime)
+        ready = [task for task in self.tasks if task.wakeAt <= self.now]
+        self.resume(self.rng.choice(ready))
+
+    def nextTime(self) -> float:
+        taskTime = min((task.wakeAt for task in self.tasks), default=math.inf)
+        return min(taskTime, self.timers[0][0] if self.timers else math.inf)
+
+    def runUntil(self, endMs: float, check = None) -> bool:
+        # Returns True if check() asked us to stop early
+        while self.nextTime() <= endMs:
+            self.step()
+            if check is not None and check(): return True
+        self.now = max(self.now, endMs)
+        return False
+
+    def shutdown(self):
+        self.stopping = True
+        for task in list(self.tasks):
+            task.go.release()
+            self.baton.acquire(timeout=self.hangTimeoutSecs)
+        self.tasks = []
+
+    # ------------------------------------------------------------ the robot
+
+    def log(self, message: str):
+        name = self.current.name if self.current is not None else "-"
+        self.trace.append((self.now, name, message))
+
+    def command(self, message: str):
+        # Anything that moves the robot. Used to measure how fast we react.
+        task = self.current
+        if task is not None and task.firstCommandAt is None: task.firstCommandAt = self.now
+        self.log(message)
+
+    def consolePrint(self, *args, **kwargs):
+        self.log("print: " + " ".join(str(arg) for arg in args))
+
+    def tick(self):
+        for motor in self.motors: motor.move(self.TICK_MS)
+        for callback in self.onTick: callback()
+
+    def pollSensors(self):
+        for sensor in self.distances: sensor.poll()
+
+    def motorOn(self, port: int):
+        return next((motor for motor in self.motors if motor.port == port), None)
+
+    def distanceOn(self, port: int):
+        return next((sensor for sensor in self.distances if sensor.port == port), None)
+
+
+_sim = None
+
+
+def begin(seed: int, hangTimeoutSecs: float = 5.0, traceSize = 80, stepCostMs: float = 1.0) -> Simulation:
+    # Start a fresh, empty world. Devices made after this belong to it.
+    global _sim
+    _sim = Simulation(seed, hangTimeoutSecs, traceSize, stepCostMs)
+    return _sim
+
+
+def _current() -> Simulation:
+    if _sim is None: raise RuntimeError("call vex.begin() before running robot code")
+    return _sim
+
+
+def wait(time: float, units = MSEC):
+    _current().sleep(_toMs(time, units))
+
+
+sleep = wait
+
+
+# ============================================================================
+# Devices
+# ============================================================================
+
+class Event:
+    def __init__(self, callback = None):
+        self.sim = _current()
+        self.callbacks: list = [] if callback is None else [callback]
+
+    def __call__(self, callback):
+        self.callbacks.append(callback)
+
+    def broadcast(self):
+        for callback in self.callbacks:
+            self.sim.spawn(callback, callback.__name__, "event")
+
+    def broadcast_and_wait(self):
+        tasks = [self.sim.spawn(callback, callback.__name__, "event") for callback in self.callbacks]
+        while any(task.alive for task in tasks): self.sim.sleep(self.sim.TICK_MS)
+
+
+class Thread:
+    def __init__(self, callback):
+        self.task = _current().spawn(callback, callback.__name__, "thread")
+
+    def stop(self):
+        if self.task.alive: self.task.sim.stop(self.task)
+
+
+class _Screen:
+    def __init__(self, sim: Simulation):
+        self.sim = sim
+
+    def print(self, *args, **kwargs):
+        self.sim.log("screen: " + " ".join(str(arg) for arg in args))
+
+    def _ignore(self, *args, **kwargs):
+        pass
+
+    clear_screen = clear_row = new_line = next_row = set_cursor = set_font = _ignore
+    set_fill_color = set_pen_color = draw_rectangle = draw_circle = draw_line = _ignore
+
+
+class Brain:
+    def __init__(self):
+        self.sim = _current()
+        self.screen = _Screen(self.sim)
+
+    def play_sound(self, sound, *args):
+        self.sim.log("sound %s" % sound)
+
+
+class Inertial:
+    def __init__(self, port = None):
+        pass
+
+    def calibrate(self):
+        pass
+
+    def is_calibrating(self) -> bool:
+        return False
+
+    def heading(self, *args) -> float:
+        return 0.0
+
+    def rotation(self, *args) -> float:
+        return 0.0
+
+
+class Motor:
+    DEGREES_PER_MS = 0.72  # About 120 rpm at 100%
+
+    def __init__(self, port: int, *args):
+        # Motor(port), Motor(port, reversed) or Motor(port, gearRatio, reversed)
+        self.sim = _current()
+        self.port = port
+        self.reversed: bool = bool(args[-1]) if args and isinstance(args[-1], bool) else False
+        self.velocityPercent: float = 50.0
+        self.stopping = COAST
+        self.direction = None  # None when stopped
+        self.degrees: float = 0.0
+        self.moved: float = 0.0  # Degrees moved in the last tick (+ is FORWARD)
+        self.target = None  # Where spin_for() should stop
+        self.sim.motors.append(self)
+
+    def __repr__(self):
+        return "Motor(PORT%d)" % (self.port + 1)
+
+    def set_velocity(self, velocity: float, units = PERCENT):
+        self.velocityPercent = velocity
+
+    def set_stopping(self, mode):
+        self.stopping = mode
+
+    def set_max_torque(self, value: float, units = PERCENT):
+        pass
+
+    def set_timeout(self, value: float, units = MSEC):
+        pass
+
+    def set_position(self, value: float, units = DEGREES):
+        self.degrees = _toDegrees(value, units)
+
+    def position(self, units = DEGREES) -> float:
+        return self.degrees / 360 if units is TURNS else self.degrees
+
+    def velocity(self, units = PERCENT) -> float:
+        return self.velocityPercent if self.direction is not None else 0.0
+
+    def is_spinning(self) -> bool:
+        return self.direction is not None
+
+    def is_done(self) -> bool:
+        return self.target is None
+
+    def spin(self, direction, velocity = None, units = PERCENT):
+        if velocity is not None: self.velocityPercent = velocity
+        self.sim.command("%r spin %r" % (self, direction))
+        self.direction = direction
+        self.target = None
+
+    def spin_for(self, direction, angle: float, units = DEGREES, velocity = None,
+                 units_v = PERCENT, wait: bool = True):
+        if velocity is not None: self.velocityPercent = velocity
+        self.sim.command("%r spin_for %r %g" % (self, direction, angle))
+        sign = 1 if direction is FORWARD else -1
+        self.direction = direction
+        self.target = self.degrees + sign * _toDegrees(angle, units)
+        while wait and self.target is not None:
+            self.sim.sleep(self.sim.TICK_MS)
+
+    def stop(self, mode = None):
+        self.sim.command("%r stop" % self)
+        if mode is not None: self.stopping = mode
+        self.direction = None
+        self.target = None
+
+    def move(self, ms: float):
+        self.moved = 0.0
+        if self.direction is None: return
+        sign = 1 if self.direction is FORWARD else -1
+        step = sign * self.DEGREES_PER_MS * abs(self.velocityPercent) / 100 * ms
+        if self.target is not None and abs(self.target - self.degrees) <= abs(step):
+            step = self.target - self.degrees
+            self.direction = None
+            self.target = None
+        self.degrees += step
+        self.moved = step
+
+
+class Distance:
+    def __init__(self, port: int):
+        self.sim = _current()
+        self.port = port
+        self.trueMm: float = 1000.0  # Set by whoever simulates the world
+        self.lastReported = None
+        self.callbacks: list = []
+        self.tasks: list = []
+        self.sim.distances.append(self)
+
+    def installed(self) -> bool:
+        return True
+
+    def object_distance(self, units = MM) -> float:
+        mm = self.sim.sensorNoise(self.trueMm)
+        return mm / 25.4 if units is INCHES else mm
+
+    def is_object_detected(self) -> bool:
+        return self.object_distance(MM) < 1000
+
+    def changed(self, callback):
+        self.callbacks.append(callback)
+
+    def poll(self):
+        if not self.callbacks: return
+        # Like buttons, a new change starts a new handler even if the last
+        # one is still running. We don't know for sure the brain does this,
+        # but overlapping handlers are the harder case to survive, so that's
+        # the default. Set coalesceSensorEvents to drop changes instead.
+        if self.sim.coalesceSensorEvents and any(task.alive for task in self.tasks): return
+        reading = round(self.sim.sensorNoise(self.trueMm))
+        if reading == self.lastReported: return
+        self.lastReported = reading
+        self.tasks = [self.sim.spawn(callback, "%s(PORT%d)" % (callback.__name__, self.port + 1), "event")
+                      for callback in self.callbacks]
+
+
+class Pneumatic:
+    def __init__(self, port: int):
+        self.sim = _current()
+        self.port = port
+        self.cylinders: dict = {CylinderType.CYLINDER1: "retracted", CylinderType.CYLINDER2: "retracted"}
+        self.pumping: bool = False
+        self.sim.pneumatics.append(self)
+
+    def __repr__(self):
+        return "Pneumatic(PORT%d)" % (self.port + 1)
+
+    def state(self) -> tuple:
+        return tuple(self.cylinders[cylinder] for cylinder in sorted(self.cylinders, key=lambda c: c.value))
+
+    def _set(self, cylinder, state: str):
+        self.sim.command("%r %s %r" % (self, state, cylinder))
+        if cylinder is CylinderType.CYLINDERALL:
+            for each in self.cylinders: self.cylinders[each] = state
+        else:
+            self.cylinders[cylinder] = state
+
+    def extend(self, cylinder = CylinderType.CYLINDERALL):
+        self._set(cylinder, "extended")
+
+    def retract(self, cylinder = CylinderType.CYLINDERALL):
+        self._set(cylinder, "retracted")
+
+    def pump_on(self):
+        self.pumping = True
+
+    def pump_off(self):
+        self.pumping = False
+
+    def pump(self, state: bool):
+        self.pumping = state
+
+
+class Touchled:
+    def __init__(self, port: int):
+        self.port = port
+
+    def set_color(self, *args):
+        pass
+
+    def set_brightness(self, *args):
+        pass
+
+    def on(self, *args):
+        pass
+
+    def off(self):
+        pass
+
+
+class _Button:
+    def __init__(self, sim: Simulation, name: str):
+        self.sim = sim
+        self.name = name
+        self.down: bool = False
+        self.onPressed: list = []
+        self.onReleased: list = []
+
+    def pressed(self, callback):
+        self.onPressed.append(callback)
+
+    def released(self, callback):
+        self.onReleased.append(callback)
+
+    def pressing(self) -> bool:
+        return self.down
+
+    # These two are for the test harness, not the robot code
+    def press(self) -> list:
+        self.down = True
+        self.sim.log("%s pressed" % self.name)
+        return [self.sim.spawn(callback, self.name, "button") for callback in self.onPressed]
+
+    def release(self) -> list:
+        if not self.down: return []  # A real button can't be let go twice
+        self.down = False
+        self.sim.log("%s released" % self.name)
+        return [self.sim.spawn(callback, self.name, "button") for callback in self.onReleased]
+
+
+class Bumper(_Button):
+    def __init__(self, port: int):
+        super().__init__(_current(), "Bumper(PORT%d)" % (port + 1))
+        self.port = port
+
+
+class _Axis:
+    def __init__(self):
+        self.value: float = 0.0
+
+    def position(self) -> float:
+        return self.value
+
+    def changed(self, callback):
+        pass
+
+
+class Controller:
+    BUTTONS = ("buttonEUp", "buttonEDown", "buttonFUp", "buttonFDown", "buttonLUp",
+               "buttonLDown", "buttonRUp", "buttonRDown", "buttonL3", "buttonR3")
+
+    def __init__(self):
+        self.sim = _current()
+        self.buttons: dict = {}
+        for name in self.BUTTONS:
+            self.buttons[name] = _Button(self.sim, name)
+            setattr(self, name, self.buttons[name])
+        self.axisA = _Axis()
+        self.axisB = _Axis()
+        self.axisC = _Axis()
+        self.axisD = _Axis()
+        self.sim.controllers.append(self)